@@ -3,6 +3,8 @@ import os
 import numpy as np
 import pandas as pd
 import pytest
+from geopandas import GeoDataFrame
+from shapely.geometry import LineString
 
 import trackintel as ti
 from trackintel.analysis.labelling import _check_categories
@@ -111,3 +113,78 @@ class TestPredict_transport_mode:
         with pytest.raises(ValueError):
             incorrect_dict = {10: "cat1", 5: "cat2", np.inf: "cat3"}
             tpls.as_triplegs.predict_transport_mode(method="simple-coarse", categories=incorrect_dict)
+
+    def test_default_categories(self):
+        """Test that the default categories give the same modes as the documented default dict."""
+        tpls_file = os.path.join("tests", "data", "triplegs_transport_mode_identification.csv")
+        tpls = ti.read_triplegs_csv(tpls_file, sep=";", index_col="id", crs="EPSG:4326")
+        categories = {15 / 3.6: "slow_mobility", 100 / 3.6: "motorized_mobility", np.inf: "fast_mobility"}
+
+        tpls_default = ti.analysis.predict_transport_mode(tpls)
+        tpls_dict = ti.analysis.predict_transport_mode(tpls, categories=categories)
+        pd.testing.assert_series_equal(tpls_default["mode"], tpls_dict["mode"])
+
+    def test_simple_coarse_category_boundaries(self):
+        """Test that speeds equal to a boundary fall in the next category and speeds above all bounds get None."""
+        t = pd.Timestamp("1971-01-01 00:00:00", tz="utc")
+        list_dict = [
+            {
+                "user_id": 0,
+                "started_at": t,
+                "finished_at": t + pd.Timedelta(seconds=10),
+                "geometry": LineString([(0, 0), (5, 0)]),
+            },
+            {
+                "user_id": 0,
+                "started_at": t,
+                "finished_at": t + pd.Timedelta(seconds=10),
+                "geometry": LineString([(0, 0), (10, 0)]),
+            },
+            {
+                "user_id": 0,
+                "started_at": t,
+                "finished_at": t + pd.Timedelta(seconds=10),
+                "geometry": LineString([(0, 0), (50, 0)]),
+            },
+        ]
+        tpls = GeoDataFrame(data=list_dict, geometry="geometry", crs="EPSG:2056")
+        tpls = tpls.as_triplegs.predict_transport_mode(method="simple-coarse", categories={1: "cat1", 2: "cat2"})
+        assert tpls["mode"].tolist() == ["cat1", "cat2", None]
+
+    def test_copy(self):
+        """Test that the input triplegs only get the mode column if copy is False."""
+        tpls_file = os.path.join("tests", "data", "triplegs_transport_mode_identification.csv")
+        tpls = ti.read_triplegs_csv(tpls_file, sep=";", index_col="id", crs="EPSG:4326")
+
+        user_id = tpls["user_id"].copy()
+        tpls_copy = tpls.as_triplegs.predict_transport_mode(method="simple-coarse", copy=True)
+        assert "mode" not in tpls.columns
+        assert tpls_copy is not tpls
+        tpls_copy.loc[tpls_copy.index[0], "user_id"] = 999
+        pd.testing.assert_series_equal(tpls["user_id"], user_id)
+
+        tpls_inplace = tpls.as_triplegs.predict_transport_mode(method="simple-coarse", copy=False)
+        assert tpls_inplace is tpls
+        pd.testing.assert_series_equal(tpls["mode"], tpls_copy["mode"])
+
+    def test_accessor_default_inplace(self):
+        """Test that the accessor adds the mode column in place while the function copies by default."""
+        tpls_file = os.path.join("tests", "data", "triplegs_transport_mode_identification.csv")
+        tpls = ti.read_triplegs_csv(tpls_file, sep=";", index_col="id", crs="EPSG:4326")
+
+        tpls_function = ti.analysis.predict_transport_mode(tpls)
+        assert "mode" not in tpls.columns
+
+        tpls_accessor = tpls.as_triplegs.predict_transport_mode()
+        assert tpls_accessor is tpls
+        pd.testing.assert_series_equal(tpls["mode"], tpls_function["mode"])
+
+    def test_accessor_geodataframe_unchanged(self):
+        """Test that the accessor on a plain GeoDataFrame leaves the GeoDataFrame unchanged."""
+        tpls_file = os.path.join("tests", "data", "triplegs_transport_mode_identification.csv")
+        tpls = ti.read_triplegs_csv(tpls_file, sep=";", index_col="id", crs="EPSG:4326")
+        gdf = GeoDataFrame(tpls)
+
+        tpls_accessor = gdf.as_triplegs.predict_transport_mode()
+        assert "mode" not in gdf.columns
+        assert "mode" in tpls_accessor.columns
@@ -471,6 +471,14 @@ class TestSimpleSpeedTriplegs:
         tpls_speed = ti.geogr.distances.get_speed_triplegs(tpls)
         assert_geodataframe_equal(tpls, tpls_speed.drop(columns=["speed"]))
 
+    def test_triplegs_independent(self, example_triplegs):
+        """Test whether editing the returned triplegs in place leaves the input triplegs untouched"""
+        _, tpls = example_triplegs
+        user_id = tpls["user_id"].copy()
+        tpls_speed = ti.geogr.distances.get_speed_triplegs(tpls)
+        tpls_speed.loc[tpls_speed.index[0], "user_id"] = 777
+        pd.testing.assert_series_equal(tpls["user_id"], user_id)
+
     def test_one_speed_correct(self, example_triplegs):
         """Test with one example whether the computed speeds are correct"""
         _, tpls = example_triplegs
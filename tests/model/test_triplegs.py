@@ -2,7 +2,7 @@ import os
 
 import pytest
 import geopandas as gpd
-from shapely.geometry import Point
+from shapely.geometry import LineString, Point
 
 import trackintel as ti
 from trackintel import Triplegs
@@ -52,3 +52,19 @@ class TestTriplegs:
         tpls = testdata_tpls.as_triplegs
         assert type(tpls) is Triplegs
         assert id(tpls) == id(tpls.as_triplegs)
+
+    def test_accessor_invalid_geometry(self, testdata_tpls):
+        """Test if the as_triplegs accessor requires valid geometries."""
+        tpls = testdata_tpls.copy()
+        tpls.loc[tpls.index[0], "geom"] = LineString([(0, 0), (0, 0)])
+
+        with pytest.raises(AssertionError, match="Not all geometries are valid"):
+            tpls.as_triplegs
+
+    def test_triplegs_edited_invalid_geometry(self, testdata_tpls):
+        """Test if constructing Triplegs from edited Triplegs validates the geometries again."""
+        tpls = Triplegs(testdata_tpls.copy())
+        tpls.loc[tpls.index[0], "geom"] = LineString([(0, 0), (0, 0)])
+
+        with pytest.raises(AssertionError, match="Not all geometries are valid"):
+            Triplegs(tpls)
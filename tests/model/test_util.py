@@ -14,9 +14,9 @@ from trackintel.model.util import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def example_positionfixes():
-    """Positionfixes for tests."""
+    """Positionfixes for tests (shared within the module -> do not modify them in place)."""
     p1 = Point(8.5067847, 47.4)
     p2 = Point(8.5067847, 47.5)
     p3 = Point(8.5067847, 47.6)
@@ -79,6 +79,18 @@ class Test_wrapped_gdf_method:
         a = A(example_positionfixes)
         assert type(foo(a)) is B
 
+    def test_wraps(self):
+        """Test if metadata of the wrapped function is kept"""
+
+        def foo(gdf: GeoDataFrame) -> GeoDataFrame:
+            """Docstring of foo"""
+            return gdf
+
+        wrapped = _wrapped_gdf_method(foo)
+        assert wrapped.__name__ == "foo"
+        assert wrapped.__doc__ == "Docstring of foo"
+        assert wrapped.__wrapped__ is foo
+
     def test_no_fallback(self, example_positionfixes):
         """Test if fallback_class is not set then fallback_class is not used."""
 
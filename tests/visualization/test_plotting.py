@@ -41,9 +41,9 @@ def triplegs_with_modes():
     return df
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_data():
-    """Read tests data from files."""
+    """Read tests data from files (shared within the module -> do not modify them in place)."""
     pfs_file = os.path.join("examples", "data", "geolife_trajectory.csv")
     pfs = ti.read_positionfixes_csv(pfs_file, sep=";", index_col=None, crs="EPSG:4326")
 
@@ -102,9 +102,9 @@ class TestPlot_modal_split:
         modal_split = calculate_modal_split(triplegs_with_modes, freq="d", per_user=False, norm=True)
         plot_modal_split(modal_split)
 
-    def test_create_plot_testdata(self, triplegs_with_modes):
+    def test_create_plot_testdata(self, triplegs_with_modes, tmp_path):
         """Create a modal split plot based on randomly generated test data"""
-        tmp_file = os.path.join("tests", "data", "modal_split_plot.png")
+        tmp_file = str(tmp_path / "modal_split_plot.png")
 
         modal_split = calculate_modal_split(triplegs_with_modes, freq="d", per_user=False, norm=True)
 
@@ -114,8 +114,6 @@ class TestPlot_modal_split:
         )
 
         assert os.path.exists(tmp_file)
-        os.remove(tmp_file)
-        os.remove(tmp_file.replace("png", "pdf"))
 
     def test_ax_arg(self, triplegs_with_modes):
         """Test if ax is augmented if passed to function."""
@@ -203,13 +201,12 @@ class TestPlot:
         with pytest.raises(ValueError, match="At least one GeoDataFrame should not be None."):
             plot()
 
-    def test_plot_file(self, test_data):
+    def test_plot_file(self, test_data, tmp_path):
         """Test if plotting to file produces a file"""
         pfs, sp, tpls, locs = test_data
-        tmp_file = os.path.join("tests", "data", "temp.png")
+        tmp_file = str(tmp_path / "temp.png")
         plot(positionfixes=pfs, staypoints=sp, triplegs=tpls, locations=locs, filename=tmp_file)
         assert os.path.exists(tmp_file)
-        os.remove(tmp_file)
 
     def test_osm(self, test_data):
         """Test call to plot_osm"""
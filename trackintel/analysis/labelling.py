@@ -1,9 +1,18 @@
 import datetime
+from itertools import islice
 
 import numpy as np
 
 from trackintel.geogr import get_speed_triplegs
 
+# default categories of 'simple-coarse' as upper boundaries [m/s] and labels
+# the additional None label is assigned to speeds that are not below any boundary (e.g. nan)
+_DEFAULT_BOUNDS = np.array([15 / 3.6, 100 / 3.6, np.inf])
+_DEFAULT_LABELS = np.array(["slow_mobility", "motorized_mobility", "fast_mobility", None], dtype=object)
+_DEFAULT_BOUNDS.setflags(write=False)
+_DEFAULT_LABELS.setflags(write=False)
+_DEFAULT_CATEGORIES = (_DEFAULT_BOUNDS, _DEFAULT_LABELS)  # only used internally, users pass a dict
+
 
 def create_activity_flag(staypoints, method="time_threshold", time_threshold=15.0, activity_column_name="is_activity"):
     """
@@ -33,16 +42,16 @@ def create_activity_flag(staypoints, method="time_threshold", time_threshold=15.
     >>> print(sp['is_activity'])
     """
     if method == "time_threshold":
-        staypoints[activity_column_name] = staypoints["finished_at"] - staypoints["started_at"] > datetime.timedelta(
-            minutes=time_threshold
-        )
+        # compare on the numpy datetime64 arrays -> no Timedelta boxing and NaT compares as False
+        duration = staypoints["finished_at"].values - staypoints["started_at"].values
+        staypoints[activity_column_name] = duration > np.timedelta64(datetime.timedelta(minutes=time_threshold))
     else:
         raise AttributeError(f"Method {method} not known for creating activity flag.")
 
     return staypoints
 
 
-def predict_transport_mode(triplegs, method="simple-coarse", **kwargs):
+def predict_transport_mode(triplegs, method="simple-coarse", copy=True, **kwargs):
     """
     Predict the transport mode of triplegs.
 
@@ -57,6 +66,10 @@ def predict_transport_mode(triplegs, method="simple-coarse", **kwargs):
         The following methods are available for transport mode inference/prediction:
         - 'simple-coarse' : Uses simple heuristics to predict coarse transport classes.
 
+    copy: bool, default True
+        If True, the mode column is added to an independent copy of the triplegs.
+        If False, the column is added to the input triplegs directly.
+
     Returns
     -------
     triplegs : GeoDataFrame (as trackintel triplegs)
@@ -77,16 +90,14 @@ def predict_transport_mode(triplegs, method="simple-coarse", **kwargs):
     """
     if method == "simple-coarse":
         # implemented as keyword argument if later other methods that don't use categories are added
-        categories = kwargs.pop(
-            "categories", {15 / 3.6: "slow_mobility", 100 / 3.6: "motorized_mobility", np.inf: "fast_mobility"}
-        )
+        categories = kwargs.pop("categories", _DEFAULT_CATEGORIES)
 
-        return _predict_transport_mode_simple_coarse(triplegs, categories)
+        return _predict_transport_mode_simple_coarse(triplegs, categories, copy=copy)
     else:
         raise AttributeError(f"Method {method} not known for predicting tripleg transport modes.")
 
 
-def _predict_transport_mode_simple_coarse(triplegs_in, categories):
+def _predict_transport_mode_simple_coarse(triplegs_in, categories, copy=False):
     """
     Predict a transport mode out of three coarse classes.
 
@@ -103,6 +114,9 @@ def _predict_transport_mode_simple_coarse(triplegs_in, categories):
         The unit for the upper boundary is m/s.
         The default is {15/3.6: 'slow_mobility', 100/3.6: 'motorized_mobility', np.inf: 'fast_mobility'}.
 
+    copy : bool, default False
+        If True, work on an independent copy of the triplegs, otherwise add the mode column to triplegs_in.
+
     Raises
     ------
     ValueError
@@ -117,32 +131,22 @@ def _predict_transport_mode_simple_coarse(triplegs_in, categories):
     :func:`trackintel.analysis.transport_mode_identification.predict_transport_mode`.
 
     """
-    if not (_check_categories(categories)):
-        raise ValueError("the categories must be in increasing order")
-
-    triplegs = triplegs_in.copy()
-
-    def category_by_speed(speed):
-        """
-        Identify the mode based on the (overall) tripleg speed.
-
-        Parameters
-        ----------
-        speed : float
-            the speed of one tripleg
-
-        Returns
-        -------
-        str
-            the identified mode.
-        """
-        for bound in categories:
-            if speed < bound:
-                return categories[bound]
+    if categories is _DEFAULT_CATEGORIES:
+        bounds, labels = _DEFAULT_CATEGORIES
+    else:
+        if not (_check_categories(categories)):
+            raise ValueError("the categories must be in increasing order")
+        bounds = np.fromiter(categories.keys(), dtype=float, count=len(categories))
+        labels = np.array([*categories.values(), None], dtype=object)
 
+    # a deep copy only copies the references to the (immutable) shapely geometries
+    triplegs = triplegs_in.copy() if copy else triplegs_in
     triplegs_speed = get_speed_triplegs(triplegs)
 
-    triplegs["mode"] = triplegs_speed["speed"].apply(category_by_speed)
+    # speed < bound <=> first bound strictly larger than speed -> side="right"
+    # speeds not smaller than any bound (e.g. nan) get index len(bounds) and map to None
+    idx = np.searchsorted(bounds, triplegs_speed["speed"].to_numpy(dtype=float), side="right")
+    triplegs["mode"] = labels[idx]
     return triplegs
 
 
@@ -152,7 +156,7 @@ def _check_categories(cat):
 
     Parameters
     ----------
-    cat : disct
+    cat : dict
         the dictionary to be checked.
 
     Returns
@@ -161,9 +165,5 @@ def _check_categories(cat):
         True if dict keys are in ascending order False otherwise.
 
     """
-    correct = True
-    bounds = list(cat.keys())
-    for i in range(len(bounds) - 1):
-        if bounds[i] >= bounds[i + 1]:
-            correct = False
-    return correct
+    # pairwise over the dict keys without materializing them (typically only a handful of categories)
+    return all(lower < upper for lower, upper in zip(cat, islice(cat, 1, None)))
@@ -394,13 +394,15 @@ def get_speed_triplegs(triplegs, positionfixes=None, method="tpls_speed"):
     # Simple method: Divide overall tripleg distance by overall duration
     if method == "tpls_speed":
         if check_gdf_planar(triplegs):
-            distance = triplegs.length
+            distance = triplegs.length.to_numpy()
         else:
             distance = calculate_haversine_length(triplegs)
-        duration = (triplegs["finished_at"] - triplegs["started_at"]).dt.total_seconds()
+        # duration in seconds directly on the datetime64 arrays
+        duration = (triplegs["finished_at"].values - triplegs["started_at"].values) / np.timedelta64(1, "s")
         # The unit of the speed is m/s
         tpls = triplegs.copy()
-        tpls["speed"] = distance / duration
+        with np.errstate(divide="ignore", invalid="ignore"):  # zero durations -> inf/nan as with pandas
+            tpls["speed"] = distance / duration
         return tpls
 
     # Pfs-based method: compute speed per positionfix and average then
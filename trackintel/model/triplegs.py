@@ -1,5 +1,6 @@
 import pandas as pd
 
+# functions are looked up via ti at call time: their modules import Triplegs -> circular import otherwise
 import trackintel as ti
 from trackintel.model.util import (
     TrackintelBase,
@@ -10,6 +11,7 @@ from trackintel.model.util import (
 )
 
 _required_columns = ["user_id", "started_at", "finished_at"]
+_required_columns_set = frozenset(_required_columns)
 
 
 @_register_trackintel_accessor("as_triplegs")
@@ -53,19 +55,20 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
     def validate(obj):
         assert obj.shape[0] > 0, f"Geodataframe is empty with shape: {obj.shape}"
         # check columns
-        if any([c not in obj.columns for c in _required_columns]):
+        if not _required_columns_set.issubset(obj.columns):
             raise AttributeError(
                 "To process a DataFrame as a collection of triplegs, it must have the properties"
                 f" {_required_columns}, but it has [{', '.join(obj.columns)}]."
             )
 
-        # check timestamp dtypes
+        # check timestamp dtypes (read from dtypes -> no column Series is materialized)
+        dtypes = obj.dtypes
         assert isinstance(
-            obj["started_at"].dtype, pd.DatetimeTZDtype
-        ), f"dtype of started_at is {obj['started_at'].dtype} but has to be datetime64 and timezone aware"
+            dtypes["started_at"], pd.DatetimeTZDtype
+        ), f"dtype of started_at is {dtypes['started_at']} but has to be datetime64 and timezone aware"
         assert isinstance(
-            obj["finished_at"].dtype, pd.DatetimeTZDtype
-        ), f"dtype of finished_at is {obj['finished_at'].dtype} but has to be datetime64 and timezone aware"
+            dtypes["finished_at"], pd.DatetimeTZDtype
+        ), f"dtype of finished_at is {dtypes['finished_at']} but has to be datetime64 and timezone aware"
 
         # check geometry
         assert (
@@ -110,13 +113,17 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
             staypoints, self, gap_threshold=gap_threshold, add_geometry=add_geometry
         )
 
-    def predict_transport_mode(self, method="simple-coarse", **kwargs):
+    def predict_transport_mode(self, method="simple-coarse", copy=False, **kwargs):
         """
         Predict the transport mode of triplegs.
 
+        Unlike the function, the accessor defaults to copy=False: called on Triplegs, the mode column is added
+        to them in place. Called on a plain GeoDataFrame, the accessor works on a new Triplegs object and the
+        GeoDataFrame itself stays unchanged.
+
         See :func:`trackintel.analysis.labelling.predict_transport_mode` for full documentation.
         """
-        return ti.analysis.labelling.predict_transport_mode(self, method=method, **kwargs)
+        return ti.analysis.labelling.predict_transport_mode(self, method=method, copy=copy, **kwargs)
 
     def calculate_modal_split(self, freq=None, metric="count", per_user=False, norm=False):
         """
@@ -12,6 +12,8 @@ def _wrapped_gdf_method(func):
     @wraps(func)  # copy all metadata
     def wrapper(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
+        if type(result) is type(self):  # nothing to downcast
+            return result
         if isinstance(result, pd.DataFrame):
             if isinstance(result, GeoDataFrame):
                 result.__class__ = self.__class__